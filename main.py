@@ -2,6 +2,7 @@
 TensorPool MCP Server (FastMCP)
 
 Implements tools that wrap the TensorPool `tp` CLI for clusters and jobs.
+- Read-only tools (list/info) call the TensorPool API in-process over a pooled HTTP client instead of spawning `tp`
 - Requires TENSORPOOL_API_KEY in the environment (the CLI reads it)
 - Safer SSH public key handling: accept the public key text, validate, write to a temp file, pass with `-i` to `tp cluster create`
 - Returns stdout on success; on error returns a string containing exit code, stdout, and stderr for agent reasoning
@@ -9,114 +10,428 @@ Implements tools that wrap the TensorPool `tp` CLI for clusters and jobs.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import base64
+import binascii
+import hashlib
+import json
 import os
 import shlex
-import subprocess
+import shutil
 import tempfile
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+from urllib.parse import quote
 
-from dotenv import load_dotenv
-from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 
+# mcp, httpx, tensorpool and dotenv are imported where first needed, so importing
+# this module (tests, benchmarks, reuse as a library) doesn't pay their startup cost
+if TYPE_CHECKING:
+    import httpx
+    from mcp.server.fastmcp import FastMCP
+
+
+def _ensure_api_key() -> bool:
+    """Bridge TENSORPOOL_API_KEY to TENSORPOOL_KEY (the name tp reads); True if a key is set."""
+    if os.environ.get("TENSORPOOL_KEY"):
+        return True
+    api_key = os.environ.get("TENSORPOOL_API_KEY")
+    if not api_key:
+        return False
+    os.environ["TENSORPOOL_KEY"] = api_key
+    return True
+
+
+# Importing doesn't touch os.environ: the bridge runs in create_server() after .env
+# is loaded (so a TENSORPOOL_KEY from .env still wins), or lazily on the first call
+_HAS_API_KEY = bool(os.environ.get("TENSORPOOL_KEY"))
+
+# Absolute path of the tp CLI; resolved lazily again if missing
+_TP_BIN: Optional[str] = shutil.which("tp")
+
+_TP_NOT_FOUND = "ERROR: 'tp' CLI not found. Install with: uv add tensorpool"
+
+
+def _check_api_key() -> Optional[str]:
+    """Return an error message if no API key is available, else None."""
+    global _HAS_API_KEY
+    if not _HAS_API_KEY:
+        _HAS_API_KEY = _ensure_api_key()
+        if not _HAS_API_KEY:
+            return "ERROR: TENSORPOOL_API_KEY (or TENSORPOOL_KEY) is not set in the environment."
+    return None
+
+
+_READ_CHUNK = 1024 * 1024
+# How long to wait for tp to go away after killing it
+_KILL_GRACE_S = 1
+# Per-stream cap on captured tp output; the rest is drained and dropped
+_MAX_OUTPUT_BYTES = 8 * 1024 * 1024
+
+
+async def _read_stream(
+    stream: asyncio.StreamReader, max_bytes: int
+) -> tuple[bytearray, int]:
+    """Read a subprocess pipe to EOF in large chunks; return (kept bytes, dropped byte count)."""
+    buf = bytearray()
+    dropped = 0
+    while chunk := await stream.read(_READ_CHUNK):
+        room = max_bytes - len(buf)
+        if len(chunk) > room:
+            dropped += len(chunk) - room
+            chunk = chunk[:room]
+        buf += chunk
+    return buf, dropped
+
+
+async def _communicate(
+    proc: asyncio.subprocess.Process, max_bytes: int
+) -> tuple[tuple[bytearray, int], tuple[bytearray, int]]:
+    stdout, stderr = await asyncio.gather(
+        _read_stream(proc.stdout, max_bytes), _read_stream(proc.stderr, max_bytes)
+    )
+    await proc.wait()
+    return stdout, stderr
 
-# Load .env if present (local/dev). Does not override existing env vars.
-load_dotenv(dotenv_path=Path(__file__).resolve().parent / ".env", override=False)
 
-mcp = FastMCP("TensorPool MCP", stateless_http=True, port=3000, debug=True)
+def _decode_output(stream: tuple[bytearray, int]) -> str:
+    buf, dropped = stream
+    text = buf.strip().decode("utf-8", "replace")
+    if dropped:
+        text += f"\n[... truncated {dropped} bytes]"
+    return text
 
 
-def _run_tp(args: list[str], cwd: Optional[str] = None, timeout_s: int = 600) -> str:
-    """Run the `tp` CLI with the provided arguments and return a text result."""
-    env = os.environ.copy()
+async def _run_tp(
+    args: Sequence[str],
+    cwd: Optional[str] = None,
+    timeout_s: int = 600,
+    max_output_bytes: int = _MAX_OUTPUT_BYTES,
+) -> str:
+    """
+    Run the `tp` CLI with the provided arguments and return a text result.
+    tp has no serve/repl mode to keep a process alive, so each call spawns a fresh CLI.
+    """
+    if err := _check_api_key():
+        return err
 
-    # Ensure the CLI sees an API key; accept either var and bridge if needed
-    tp_api_key = env.get("TENSORPOOL_API_KEY") or env.get("TENSORPOOL_KEY")
-    if not tp_api_key:
-        return "ERROR: TENSORPOOL_API_KEY (or TENSORPOOL_KEY) is not set in the environment."
-    # Bridge to the name expected by tp if only TENSORPOOL_API_KEY is set
-    if not env.get("TENSORPOOL_KEY") and env.get("TENSORPOOL_API_KEY"):
-        env["TENSORPOOL_KEY"] = env["TENSORPOOL_API_KEY"]
+    global _TP_BIN
+    if _TP_BIN is None:
+        _TP_BIN = shutil.which("tp")
+        if _TP_BIN is None:
+            return _TP_NOT_FOUND
 
-    cmd = ["tp", *args]
     try:
-        p = subprocess.run(
-            cmd,
+        proc = await asyncio.create_subprocess_exec(
+            _TP_BIN,
+            *args,
             cwd=cwd,
-            env=env,
-            text=True,
-            capture_output=True,
-            timeout=timeout_s,
-            check=False,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_READ_CHUNK,
+            # With an absolute executable and no cwd, subprocess uses posix_spawn
+            # instead of fork+exec (closing fds via posix_spawn_file_actions_addclosefrom)
         )
-    except FileNotFoundError:
-        return "ERROR: 'tp' CLI not found. Install with: uv add tensorpool"
-    except subprocess.TimeoutExpired:
-        return f"ERROR: Command timed out after {timeout_s}s: {shlex.join(cmd)}"
+    except FileNotFoundError as e:
+        # A missing cwd raises the same error; only drop the cached path for the binary
+        if e.filename != _TP_BIN:
+            return f"ERROR: Working directory not found: {e.filename}"
+        # Binary moved or removed since it was resolved; look it up again next call
+        _TP_BIN = None
+        return _TP_NOT_FOUND
 
-    out = (p.stdout or "").strip()
-    err = (p.stderr or "").strip()
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            _communicate(proc, max_output_bytes), timeout_s
+        )
+    except TimeoutError:
+        return f"ERROR: Command timed out after {timeout_s}s: {shlex.join((_TP_BIN, *args))}"
+    finally:
+        # Don't leave the CLI running on timeout or cancellation. Process.wait()
+        # also waits for the pipes to close, which a leftover grandchild can hold
+        # open, so cap it to keep timeout_s a hard bound.
+        if proc.returncode is None:
+            proc.kill()
+            try:
+                await asyncio.wait_for(proc.wait(), _KILL_GRACE_S)
+            except TimeoutError:
+                pass
 
-    if p.returncode == 0:
+    # Decode stderr only on error
+    out = _decode_output(stdout)
+    if proc.returncode == 0:
         return out or "OK"
-    return f"ERROR (exit={p.returncode})\nSTDOUT:\n{out}\n\nSTDERR:\n{err}"
+    err = _decode_output(stderr)
+    return f"ERROR (exit={proc.returncode})\nSTDOUT:\n{out}\n\nSTDERR:\n{err}"
 
 
-def _validate_public_key(pub: str) -> str:
-    """Minimal validation to prevent accidental private key submission."""
-    pub = (pub or "").strip()
+_API_TIMEOUT_S = 30
+
+# Shared keep-alive client for TensorPool API reads; bound to the loop that created it
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+_HTTP_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _http_client() -> httpx.AsyncClient:
+    import httpx
+    from tensorpool import helpers as tp_sdk
+
+    global _HTTP_CLIENT, _HTTP_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTP_CLIENT is None or _HTTP_LOOP is not loop:
+        await _close_http_client()
+        _HTTP_CLIENT = httpx.AsyncClient(
+            base_url=tp_sdk.ENGINE,
+            timeout=_API_TIMEOUT_S,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        _HTTP_LOOP = loop
+    return _HTTP_CLIENT
+
+
+async def _close_http_client() -> None:
+    global _HTTP_CLIENT, _HTTP_LOOP
+    client, _HTTP_CLIENT, _HTTP_LOOP = _HTTP_CLIENT, None, None
+    if client is None:
+        return
+    try:
+        await client.aclose()
+    except Exception:
+        # Best-effort: connections from a previous (closed) loop may not close cleanly
+        pass
+
+
+def _api_headers() -> dict[str, str]:
+    """Same headers the tensorpool CLI sends; _check_api_key() ensures TENSORPOOL_KEY is set."""
+    return {
+        "X-Client-Type": "cli",
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {os.environ['TENSORPOOL_KEY']}",
+    }
+
+
+async def _api_get(path: str, params: Optional[dict[str, str]] = None) -> str:
+    """
+    GET a TensorPool API endpoint in-process and return a text result.
+    Mirrors the read-only `tensorpool` helpers, but over a pooled connection.
+    """
+    import httpx
 
+    if err := _check_api_key():
+        return err
+
+    try:
+        client = await _http_client()
+        r = await client.get(path, params=params, headers=_api_headers())
+    except httpx.HTTPError as e:
+        return f"ERROR: TensorPool API request failed: {e}"
+
+    try:
+        result = r.json()
+    except ValueError:
+        return f"ERROR: Failed to decode server response. Status code: {r.status_code}"
+    if not isinstance(result, dict):
+        return f"ERROR: Unexpected server response. Status code: {r.status_code}"
+
+    message = str(result.get("message") or "").strip()
+    if r.status_code != 200:
+        return f"ERROR: {message or f'Request failed. Status code {r.status_code}'}"
+    return message or "OK"
+
+
+# The SDK sends the flag via requests, which encodes True as "True"
+_ORG_PARAMS = {"org": "True"}
+
+
+# Basic OpenSSH public key formats -> (min, max) size of the decoded key blob
+_SSH_KEY_BLOB_BOUNDS = {
+    "ssh-ed25519": (51, 51),
+    # From the mpint layout: 1024-bit modulus with a 1-byte exponent (e.g. PuTTYgen's
+    # e=37) up to a 16384-bit modulus (OpenSSH's maximum) with a few bytes of exponent
+    "ssh-rsa": (149, 2100),
+    "ecdsa-sha2-nistp256": (104, 104),
+    "ssh-dss": (400, 460),
+    "sk-ssh-ed25519@openssh.com": (74, 330),
+}
+_ALLOWED_SSH_PREFIXES = tuple(f"{t} " for t in _SSH_KEY_BLOB_BOUNDS)
+
+# Obvious private key material
+_PRIVKEY_MARKERS = frozenset(
+    {
+        "BEGIN OPENSSH PRIVATE KEY",
+        "BEGIN RSA PRIVATE KEY",
+        "BEGIN DSA PRIVATE KEY",
+        "BEGIN EC PRIVATE KEY",
+        "BEGIN PRIVATE KEY",
+        "BEGIN ENCRYPTED PRIVATE KEY",
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _validate_public_key(pub: str) -> str:
+    """
+    Minimal validation to prevent accidental private key submission.
+    Expects already-stripped key text; results are cached per key.
+    """
     if not pub:
         raise ValueError("ssh_public_key is empty")
 
-    # Reject obvious private key material
-    if "BEGIN OPENSSH PRIVATE KEY" in pub or "BEGIN RSA PRIVATE KEY" in pub:
+    if any(m in pub for m in _PRIVKEY_MARKERS):
         raise ValueError("ssh_public_key looks like a PRIVATE key; refusing")
 
-    # Basic OpenSSH public key formats
-    allowed_prefixes = ("ssh-ed25519 ", "ssh-rsa ", "ecdsa-sha2-nistp256 ")
-    if not pub.startswith(allowed_prefixes):
+    if not pub.startswith(_ALLOWED_SSH_PREFIXES):
         raise ValueError(
             "ssh_public_key must start with a valid OpenSSH public key prefix "
             "(e.g., ssh-ed25519, ssh-rsa, ecdsa-sha2-nistp256)"
         )
 
+    # Structural check so malformed keys fail here rather than after a tp round-trip
+    parts = pub.split()
+    if len(parts) < 2:
+        raise ValueError("ssh_public_key is missing the base64 key data")
+    key_type = parts[0]
+    try:
+        blob = base64.b64decode(parts[1], validate=True)
+    except binascii.Error:
+        raise ValueError("ssh_public_key key data is not valid base64") from None
+
+    # The blob starts with the length-prefixed key type name
+    lo, hi = _SSH_KEY_BLOB_BOUNDS[key_type]
+    name = key_type.encode("ascii")
+    if (
+        not lo <= len(blob) <= hi
+        or int.from_bytes(blob[:4], "big") != len(name)
+        or blob[4 : 4 + len(name)] != name
+    ):
+        raise ValueError(f"ssh_public_key is not a well-formed {key_type} key")
+
     return pub
 
 
+@lru_cache(maxsize=256)
+def _public_key_digest(pub: str) -> str:
+    """Short sha256 hex digest of a validated public key."""
+    return hashlib.sha256(pub.encode("utf-8")).hexdigest()[:16]
+
+
+# Keep pubkey temp files on tmpfs when available so they never touch disk
+_TMPDIR = (
+    "/dev/shm"
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)
+    else tempfile.gettempdir()
+)
+
+# Public key digest -> temp file path, reused across cluster_create calls
+_PUBKEY_CACHE: dict[str, str] = {}
+_PUBKEY_LOCK = threading.Lock()
+
+
+def _is_own_key_file(path: str, data: bytes) -> bool:
+    """True if `path` is a regular 0600 file we own containing exactly `data`."""
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+    except OSError:
+        return False
+    try:
+        st = os.fstat(fd)
+        if st.st_uid != os.getuid() or st.st_mode & 0o777 != 0o600:
+            return False
+        return os.read(fd, len(data) + 1) == data
+    finally:
+        os.close(fd)
+
+
 def _write_temp_public_key(pub: str) -> str:
     """
-    Write the public key to a temp file and return the path. (0600 perms)
-    Caller is responsible for deleting the file.
+    Return the path of a temp file holding the public key. (0600 perms)
+    One file per key is written once and reused; files are removed at exit.
     """
-    fd, path = tempfile.mkstemp(prefix="tp_pubkey_", suffix=".pub")
-    try:
-        os.fchmod(fd, 0o600)
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(pub)
-            f.write("\n")
-    except Exception:
+    digest = _public_key_digest(pub)
+    data = f"{pub}\n".encode("utf-8")
+    with _PUBKEY_LOCK:
+        path = _PUBKEY_CACHE.get(digest)
+        if path is not None:
+            # Re-verify: the file may have been removed and recreated by someone else
+            if _is_own_key_file(path, data):
+                return path
+            del _PUBKEY_CACHE[digest]
+
+        path = os.path.join(_TMPDIR, f"tp_pubkey_{digest}.pub")
         try:
-            os.close(fd)
-        except Exception:
-            pass
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            if _is_own_key_file(path, data):
+                _PUBKEY_CACHE[digest] = path
+                return path
+            # Name taken by a file we can't trust; use a unique one instead
+            fd, path = tempfile.mkstemp(
+                prefix=f"tp_pubkey_{digest}_", suffix=".pub", dir=_TMPDIR
+            )
+
         try:
-            os.unlink(path)
+            os.write(fd, data)
         except Exception:
-            pass
-        raise
-    return path
+            try:
+                os.unlink(path)
+            except Exception:
+                pass
+            raise
+        finally:
+            os.close(fd)
+
+        _PUBKEY_CACHE[digest] = path
+        return path
+
+
+@atexit.register
+def _cleanup_temp_public_keys() -> None:
+    with _PUBKEY_LOCK:
+        for path in _PUBKEY_CACHE.values():
+            try:
+                os.unlink(path)
+            except Exception:
+                # Best-effort cleanup
+                pass
+        _PUBKEY_CACHE.clear()
+
+
+# Tool functions and their registration kwargs, added to the server by create_server()
+_TOOLS: list[tuple[Callable[..., Any], dict[str, Any]]] = []
+
+
+def _tool(**kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Record a tool for registration; same keyword arguments as FastMCP.tool."""
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        _TOOLS.append((fn, kwargs))
+        return fn
+
+    return decorator
+
+
+# Invariant tp argv prefixes
+_CLUSTER_CREATE = ("cluster", "create")
+_CLUSTER_DESTROY = ("cluster", "destroy", "--no-input")
+_JOB_PUSH = ("job", "push")
+_JOB_PULL = ("job", "pull")
+_JOB_CANCEL = ("job", "cancel")
 
 
 # --------------------
 # Cluster tools
 # --------------------
-@mcp.tool(
+@_tool(
     title="Create cluster",
     description="Create a TensorPool GPU cluster using an SSH public key.",
 )
-def cluster_create(
+async def cluster_create(
     ssh_public_key: str = Field(
         description="OpenSSH public key text (single line), e.g. 'ssh-ed25519 AAAA... user@host'"
     ),
@@ -130,52 +445,42 @@ def cluster_create(
     name: Optional[str] = Field(default=None, description="Optional cluster name"),
 ) -> str:
     try:
-        pub = _validate_public_key(ssh_public_key)
+        pub = _validate_public_key((ssh_public_key or "").strip())
     except ValueError as e:
         return f"ERROR: {e}"
 
-    key_path = None
-    try:
-        key_path = _write_temp_public_key(pub)
-        args = ["cluster", "create", "-i", key_path, "-t", instance_type]
-        if num_nodes and num_nodes > 1:
-            args += ["-n", str(num_nodes)]
-        if name:
-            args += ["--name", name]
-        return _run_tp(args)
-    finally:
-        if key_path:
-            try:
-                os.unlink(key_path)
-            except Exception:
-                # Best-effort cleanup
-                pass
+    key_path = _write_temp_public_key(pub)
+    args = [*_CLUSTER_CREATE, "-i", key_path, "-t", instance_type]
+    if num_nodes and num_nodes > 1:
+        args += ["-n", str(num_nodes)]
+    if name:
+        args += ["--name", name]
+    return await _run_tp(args)
 
 
-@mcp.tool(title="List clusters", description="List your TensorPool clusters.")
-def cluster_list(
+@_tool(title="List clusters", description="List your TensorPool clusters.")
+async def cluster_list(
     org: bool = Field(
         default=False, description="List organization clusters (if supported)"
     )
 ) -> str:
-    args = ["cluster", "list"]
-    if org:
-        args += ["--org"]
-    return _run_tp(args)
+    return await _api_get("/cluster/list", _ORG_PARAMS if org else None)
 
 
-@mcp.tool(title="Cluster info", description="Get info for a TensorPool cluster by id.")
-def cluster_info(
+@_tool(title="Cluster info", description="Get info for a TensorPool cluster by id.")
+async def cluster_info(
     cluster_id: str = Field(description="Cluster id"),
 ) -> str:
-    return _run_tp(["cluster", "info", cluster_id])
+    if not cluster_id:
+        return "ERROR: Cluster ID is required"
+    return await _api_get(f"/cluster/info/{quote(cluster_id, safe='')}")
 
 
-@mcp.tool(
+@_tool(
     title="Destroy cluster",
     description="Destroy a TensorPool cluster by id. Set wait=true to block until the cluster is fully deleted.",
 )
-def cluster_destroy(
+async def cluster_destroy(
     cluster_id: str = Field(description="Cluster id"),
     confirm: bool = Field(
         default=False, description="Must be true to actually destroy the cluster"
@@ -187,17 +492,32 @@ def cluster_destroy(
 ) -> str:
     if not confirm:
         return "Refusing to destroy cluster: set confirm=true to proceed."
-    args = ["cluster", "destroy", "--no-input"]
+    args = [*_CLUSTER_DESTROY]
     if wait:
         args.append("--wait")
     args.append(cluster_id)
-    return _run_tp(args)
+    return await _run_tp(args)
 
 
 # --------------------
 # Job tools
 # --------------------
-@mcp.tool(
+@lru_cache(maxsize=64)
+def _resolve_workdir(workdir: str) -> Path:
+    """Expand and canonicalize a workdir; cached since workdirs rarely move within a session."""
+    return Path(workdir).expanduser().resolve()
+
+
+def _toml_str(s: str) -> str:
+    """Quote `s` as a TOML basic string (JSON escapes are valid TOML escapes, except DEL)."""
+    return json.dumps(s, ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
+def _toml_array(xs: list[str]) -> str:
+    return "[\n" + "".join(f"  {_toml_str(x)},\n" for x in xs) + "]"
+
+
+@_tool(
     title="Write tp.config.toml",
     description="Generate a tp.config.toml for tp job push.",
 )
@@ -217,66 +537,62 @@ def job_write_config(
     ),
     filename: str = Field(default="tp.config.toml", description="Config filename"),
 ) -> str:
-    wd = Path(workdir).expanduser().resolve()
+    wd = _resolve_workdir(workdir)
     wd.mkdir(parents=True, exist_ok=True)
     cfg_path = wd / filename
 
-    def toml_list(xs: list[str]) -> str:
-        return "[\n" + "".join([f'  "{x}",\n' for x in xs]) + "]"
-
-    toml_text = (
-        f'instance_type = "{instance_type}"\n'
-        f"commands = {toml_list(commands)}\n"
-        f"outputs = {toml_list(outputs)}\n"
-        f"ignore = {toml_list(ignore)}\n"
+    toml_text = "".join(
+        (
+            f"instance_type = {_toml_str(instance_type)}\n",
+            f"commands = {_toml_array(commands)}\n",
+            f"outputs = {_toml_array(outputs)}\n",
+            f"ignore = {_toml_array(ignore)}\n",
+        )
     )
 
-    cfg_path.write_text(toml_text, encoding="utf-8")
+    cfg_path.write_bytes(toml_text.encode("utf-8"))
     return f"Wrote {cfg_path}"
 
 
-@mcp.tool(title="Push job", description="Submit a job using tp job push <config_path>.")
-def job_push(
+@_tool(title="Push job", description="Submit a job using tp job push <config_path>.")
+async def job_push(
     config_path: str = Field(description="Path to tp.config.toml"),
     workdir: Optional[str] = Field(
         default=None, description="Optional working directory for the push"
     ),
 ) -> str:
-    return _run_tp(["job", "push", config_path], cwd=workdir)
+    return await _run_tp((*_JOB_PUSH, config_path), cwd=workdir)
 
 
-@mcp.tool(title="List jobs", description="List TensorPool jobs.")
-def job_list(
+@_tool(title="List jobs", description="List TensorPool jobs.")
+async def job_list(
     org: bool = Field(default=False, description="List organization jobs"),
 ) -> str:
-    args = ["job", "list"]
-    if org:
-        args += ["--org"]
-    return _run_tp(args)
+    return await _api_get("/job/list", _ORG_PARAMS if org else None)
 
 
-@mcp.tool(title="Job info", description="Get detailed information about a job.")
-def job_info(job_id: str = Field(description="Job id")) -> str:
-    return _run_tp(["job", "info", job_id])
+@_tool(title="Job info", description="Get detailed information about a job.")
+async def job_info(job_id: str = Field(description="Job id")) -> str:
+    if not job_id:
+        return "ERROR: Job ID is required"
+    return await _api_get(f"/job/info/{quote(job_id, safe='')}")
 
 
-@mcp.tool(
+@_tool(
     title="Pull job outputs", description="Download output files from a completed job."
 )
-def job_pull(
+async def job_pull(
     job_id: str = Field(description="Job id"),
     force: bool = Field(default=False, description="Overwrite existing files"),
 ) -> str:
-    args = ["job", "pull", job_id]
+    args = [*_JOB_PULL, job_id]
     if force:
-        args += ["--force"]
-    return _run_tp(args)
+        args.append("--force")
+    return await _run_tp(args)
 
 
-@mcp.tool(
-    title="Cancel job", description="Cancel a running job (requires confirm=true)."
-)
-def job_cancel(
+@_tool(title="Cancel job", description="Cancel a running job (requires confirm=true).")
+async def job_cancel(
     job_id: str = Field(description="Job id"),
     confirm: bool = Field(
         default=False, description="Must be true to actually cancel the job"
@@ -284,8 +600,58 @@ def job_cancel(
 ) -> str:
     if not confirm:
         return "Refusing to cancel job: set confirm=true to proceed."
-    return _run_tp(["job", "cancel", job_id])
+    return await _run_tp((*_JOB_CANCEL, job_id))
+
+
+def create_server() -> FastMCP:
+    """Load .env and build the FastMCP server with all tools registered."""
+    from dotenv import load_dotenv
+    from mcp.server.fastmcp import FastMCP
+
+    global _HAS_API_KEY
+    # Load .env if present (local/dev). Does not override existing env vars.
+    load_dotenv(dotenv_path=Path(__file__).resolve().parent / ".env", override=False)
+    _HAS_API_KEY = _ensure_api_key()
+
+    server = FastMCP("TensorPool MCP", stateless_http=True, port=3000, debug=True)
+    for fn, kwargs in _TOOLS:
+        server.add_tool(fn, **kwargs)
+    return server
+
+
+def __getattr__(name: str) -> Any:
+    # Build the server on first access to `main.mcp`, for hosts that import it
+    if name == "mcp":
+        global mcp
+        mcp = create_server()
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _serve() -> None:
+    """Run streamable-http like FastMCP.run, closing the shared API client on shutdown."""
+    import uvicorn
+
+    server = create_server()
+    app = server.streamable_http_app()
+    session_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app: Any) -> AsyncIterator[None]:
+        async with session_lifespan(app):
+            try:
+                yield
+            finally:
+                await _close_http_client()
+
+    app.router.lifespan_context = lifespan
+    uvicorn.run(
+        app,
+        host=server.settings.host,
+        port=server.settings.port,
+        log_level=server.settings.log_level.lower(),
+    )
 
 
 if __name__ == "__main__":
-    mcp.run(transport="streamable-http")
+    _serve()